@@ -1,10 +1,11 @@
 import subprocess
-import yaml
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
 from functools import lru_cache
 
+from .utils import load_yaml
+
 
 class BranchManager:
     """Branch registry management and git branch operations."""
@@ -19,9 +20,8 @@ class BranchManager:
         if not cls.REGISTRY_FILE.exists():
             raise FileNotFoundError(f"Branch registry not found at {cls.REGISTRY_FILE}")
 
-        with open(cls.REGISTRY_FILE, 'r') as f:
-            data = yaml.safe_load(f)
-            return data.get('branches', {})
+        data = load_yaml(cls.REGISTRY_FILE)
+        return data.get('branches', {})
 
     @classmethod
     def load_branch_config(cls, branch_name: str) -> Optional[Dict]:
@@ -11,7 +11,7 @@ def get_service_file(service_name):
     service_files = get_services_files()
     for service_file in service_files:
         if service_file.stem == service_name:
-            return [{'service': service_file.stem, 'path': service_file}]
+            return [service_file]
 
     # Provide context about missing service
     metadata = ServiceDiscovery.get_service_metadata(service_name)
@@ -230,7 +230,7 @@ def exec(ctx, name, user, env, workdir):
     # docker compose -f service.yml exec [options] service_name command...
     compose_command = [
         "docker", "compose", "--project-name", "customer-dashboard",
-        "-f", str(service[0]['path']),
+        "-f", str(service[0]),
         "exec"
     ]
 
@@ -241,7 +241,7 @@ def exec(ctx, name, user, env, workdir):
     for env_var in env:
         compose_command.extend(["--env", env_var])
 
-    compose_command.append(service[0]['service'])
+    compose_command.append(service[0].stem)
     compose_command.extend(command)
 
 
@@ -1,18 +1,31 @@
 import subprocess
 import json
-import yaml
 import os
+import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional
 from functools import lru_cache
 
+from .utils import load_yaml
+
+# Interned label prefixes matched in the inner scan loops
+_LABEL_PREFIX = sys.intern("com.customer-dashboard.service")
+_LABEL_PREFIX_LEN = len(_LABEL_PREFIX) + 1
+_LABEL_TYPE_EQ = sys.intern(_LABEL_PREFIX + ".type=")
+_LABEL_ROLES = sys.intern(_LABEL_PREFIX + ".roles")
+_LABEL_ROLES_EQ = sys.intern(_LABEL_PREFIX + ".roles=")
+
+# Splits "web, cli, queue" in one pass, eating surrounding whitespace
+_ROLES_SPLIT = re.compile(r'\s*,\s*')
+
 
 class ServiceDiscovery:
     """Intelligent service discovery using Docker labels and service metadata."""
 
     PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT', Path(__file__).parent.parent.parent.parent.parent))
     SERVICE_DIR = PROJECT_ROOT / "docker" / "services"
-    LABEL_PREFIX = "com.customer-dashboard.service"
+    LABEL_PREFIX = _LABEL_PREFIX
     CONTAINER_PREFIX = "customer-dashboard"
 
     @classmethod
@@ -20,22 +33,56 @@ class ServiceDiscovery:
     def _load_service_file(cls, file_path: Path) -> Dict:
         """Load and parse a service YAML file."""
         try:
-            with open(file_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml(file_path)
         except Exception:
             return {}
 
+    @classmethod
+    def _load_all_service_files(cls) -> List[tuple]:
+        """Parse every service YAML file in one batched pass.
+
+        Joining the files into a multi-document stream and parsing with
+        load_all constructs a single parser instead of one per file.
+        Results are cached keyed on the file set and mtimes.
+        """
+        try:
+            files = tuple(sorted(cls.SERVICE_DIR.glob("*.yml")))
+            mtimes = tuple(path.stat().st_mtime_ns for path in files)
+            return cls._parse_service_files(files, mtimes)
+        except OSError:
+            return []
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _parse_service_files(files: tuple, mtimes: tuple) -> List[tuple]:
+        import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        try:
+            blob = b'\n---\n'.join(path.read_bytes() for path in files)
+            documents = list(yaml.load_all(blob, Loader=SafeLoader))
+            if len(documents) == len(files):
+                return list(zip(files, documents))
+        except Exception:
+            pass
+
+        # Fallback: a file was unreadable or itself multi-document
+        return [(path, ServiceDiscovery._load_service_file(path)) for path in files]
+
     @classmethod
     def find_services_by_type(cls, service_type: str) -> List[Dict]:
         """Find all services of a specific type from service files."""
         services = []
-        for yml_file in cls.SERVICE_DIR.glob("*.yml"):
-            data = cls._load_service_file(yml_file)
+        type_label = _LABEL_TYPE_EQ + service_type
+        for yml_file, data in cls._load_all_service_files():
             if 'services' in data:
                 for service_name, service_config in data['services'].items():
                     labels = service_config.get('labels', [])
                     for label in labels:
-                        if f"{cls.LABEL_PREFIX}.type={service_type}" in label:
+                        if type_label in label:
                             services.append({
                                 'name': service_name,
                                 'file_path': yml_file,
@@ -48,8 +95,7 @@ class ServiceDiscovery:
     def find_services_by_role(cls, role: str) -> List[Dict]:
         """Find all services with a specific role from service files."""
         services = []
-        for yml_file in cls.SERVICE_DIR.glob("*.yml"):
-            data = cls._load_service_file(yml_file)
+        for yml_file, data in cls._load_all_service_files():
             if 'services' in data:
                 for service_name, service_config in data['services'].items():
                     labels = service_config.get('labels', [])
@@ -96,9 +142,9 @@ class ServiceDiscovery:
                 if line:
                     container = json.loads(line)
                     labels = container.get('Labels', '')
-                    if f'{cls.LABEL_PREFIX}.roles' in labels:
+                    if _LABEL_ROLES in labels:
                         for label_pair in labels.split(','):
-                            if f'{cls.LABEL_PREFIX}.roles=' in label_pair:
+                            if _LABEL_ROLES_EQ in label_pair:
                                 roles_value = label_pair.split('=', 1)[1]
                                 if role in cls.parse_csv_roles(roles_value):
                                     containers.append(container['Names'])
@@ -170,13 +216,12 @@ class ServiceDiscovery:
         """Parse CSV role string into list."""
         if not roles_string:
             return []
-        return [role.strip() for role in roles_string.split(',')]
+        return [role for role in _ROLES_SPLIT.split(roles_string.strip()) if role]
 
     @classmethod
     def get_service_metadata(cls, service_name: str) -> Optional[Dict]:
         """Get complete metadata for a service from its YAML file."""
-        for yml_file in cls.SERVICE_DIR.glob("*.yml"):
-            data = cls._load_service_file(yml_file)
+        for yml_file, data in cls._load_all_service_files():
             if 'services' in data and service_name in data['services']:
                 service_config = data['services'][service_name]
                 labels = cls._parse_labels(service_config.get('labels', []))
@@ -194,8 +239,8 @@ class ServiceDiscovery:
         for label in labels:
             if '=' in label:
                 label = label.strip('"').strip("'")
-                if label.startswith(cls.LABEL_PREFIX):
-                    key_value = label[len(cls.LABEL_PREFIX) + 1:]
+                if label.startswith(_LABEL_PREFIX):
+                    key_value = label[_LABEL_PREFIX_LEN:]
                     if '=' in key_value:
                         key, value = key_value.split('=', 1)
                         parsed[key] = value
@@ -234,7 +279,7 @@ class ServiceDiscovery:
         parsed = {}
         if labels:
             for key, value in labels.items():
-                if key.startswith(cls.LABEL_PREFIX):
-                    short_key = key[len(cls.LABEL_PREFIX) + 1:]
+                if key.startswith(_LABEL_PREFIX):
+                    short_key = key[_LABEL_PREFIX_LEN:]
                     parsed[short_key] = value
         return parsed
@@ -70,37 +70,31 @@ def fresh(stack, no_seed, skip_assets, env_file, force_env):
         LaravelUtils.generate_app_key()
         click.echo("Generated application key")
     
-    click.echo("Installing dependencies...")
-    subprocess.run(
-        ['docker', 'exec', php_container, 'composer', 'install', '--no-interaction'],
-        capture_output=True
-    )
-    click.echo("Dependencies installed")
-    
-    migrate_cmd = ['docker', 'exec', php_container, 'php', 'artisan', 'migrate:fresh', '--force']
-    if not no_seed:
-        migrate_cmd.append('--seed')
-    
-    subprocess.run(migrate_cmd, capture_output=True)
-    click.echo("Database migrated" + (" and seeded" if not no_seed else ""))
-    
-    subprocess.run(
-        ['docker', 'exec', php_container, 'php', 'artisan', 'storage:link'],
-        capture_output=True
-    )
-    
+    from .utils import ComposeSession
+
+    # One exec session per container amortizes docker client startup
+    # across the setup steps
+    with ComposeSession(php_container) as php_session:
+        click.echo("Installing dependencies...")
+        php_session.run(['composer', 'install', '--no-interaction'])
+        click.echo("Dependencies installed")
+
+        migrate_cmd = ['php', 'artisan', 'migrate:fresh', '--force']
+        if not no_seed:
+            migrate_cmd.append('--seed')
+
+        php_session.run(migrate_cmd)
+        click.echo("Database migrated" + (" and seeded" if not no_seed else ""))
+
+        php_session.run(['php', 'artisan', 'storage:link'])
+
     if not skip_assets:
         node_container = ServiceDiscovery.get_node_container()
         if node_container:
             click.echo("Building assets...")
-            subprocess.run(
-                ['docker', 'exec', node_container, 'npm', 'install', '--silent'],
-                capture_output=True
-            )
-            subprocess.run(
-                ['docker', 'exec', node_container, 'npm', 'run', 'build'],
-                capture_output=True
-            )
+            with ComposeSession(node_container) as node_session:
+                node_session.run(['npm', 'install', '--silent'])
+                node_session.run(['npm', 'run', 'build'])
             click.echo("Assets built")
     
     LaravelUtils.clear_laravel_queues(stack)
@@ -147,46 +141,38 @@ def reset(no_seed, skip_assets, keep_data, stack):
         click.echo("Error: PHP container not running", err=True)
         sys.exit(1)
     
+    from .utils import ComposeSession
+
     LaravelUtils.clear_laravel_queues(stack or 'default')
-    subprocess.run(
-        ['docker', 'exec', php_container, 'php', 'artisan', 'optimize:clear'],
-        capture_output=True
-    )
-    
-    click.echo("Reinstalling dependencies...")
-    subprocess.run(
-        ['docker', 'exec', php_container, 'composer', 'install', '--no-interaction'],
-        capture_output=True
-    )
-    
-    if keep_data:
-        migrate_cmd = ['docker', 'exec', php_container, 'php', 'artisan', 'migrate', '--force']
-    else:
-        migrate_cmd = ['docker', 'exec', php_container, 'php', 'artisan', 'migrate:fresh', '--force']
-        if not no_seed:
-            migrate_cmd.append('--seed')
-    
-    subprocess.run(migrate_cmd, capture_output=True)
-    click.echo("Database reset")
-    
-    if not skip_assets:
-        node_container = ServiceDiscovery.get_node_container()
-        if node_container:
-            click.echo("Rebuilding assets...")
-            subprocess.run(
-                ['docker', 'exec', node_container, 'npm', 'install', '--silent'],
-                capture_output=True
-            )
-            subprocess.run(
-                ['docker', 'exec', node_container, 'npm', 'run', 'build'],
-                capture_output=True
-            )
-            click.echo("Assets rebuilt")
-    
-    subprocess.run(
-        ['docker', 'exec', php_container, 'php', 'artisan', 'storage:link'],
-        capture_output=True
-    )
+
+    # One exec session per container amortizes docker client startup
+    # across the reset steps
+    with ComposeSession(php_container) as php_session:
+        php_session.run(['php', 'artisan', 'optimize:clear'])
+
+        click.echo("Reinstalling dependencies...")
+        php_session.run(['composer', 'install', '--no-interaction'])
+
+        if keep_data:
+            migrate_cmd = ['php', 'artisan', 'migrate', '--force']
+        else:
+            migrate_cmd = ['php', 'artisan', 'migrate:fresh', '--force']
+            if not no_seed:
+                migrate_cmd.append('--seed')
+
+        php_session.run(migrate_cmd)
+        click.echo("Database reset")
+
+        if not skip_assets:
+            node_container = ServiceDiscovery.get_node_container()
+            if node_container:
+                click.echo("Rebuilding assets...")
+                with ComposeSession(node_container) as node_session:
+                    node_session.run(['npm', 'install', '--silent'])
+                    node_session.run(['npm', 'run', 'build'])
+                click.echo("Assets rebuilt")
+
+        php_session.run(['php', 'artisan', 'storage:link'])
     
     LaravelUtils.optimize_laravel_caches(stack or 'default')
     
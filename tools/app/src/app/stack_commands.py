@@ -243,7 +243,7 @@ def build(stack, no_cache, pull, verbose):
 
     command = build_compose_command(services, 'build', [], options)
 
-    service_names = [s['service'] for s in services]
+    service_names = [s.stem for s in services]
     click.echo(f"Building stack '{stack}' ({len(service_names)} services)...")
     
     for i, service_name in enumerate(service_names, 1):
@@ -329,7 +329,7 @@ def status(stack):
     if stack != "all":
         try:
             services = get_services_for_stack(stack)
-            expected_services = [s['service'] for s in services]
+            expected_services = [s.stem for s in services]
         except Exception as e:
             click.secho(f"Error loading stack '{stack}': {e}", fg="red")
             sys.exit(1)
@@ -1,10 +1,22 @@
 import json
 import subprocess
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import os
 
+# Interned status strings: long-running dashboard polls reload state
+# constantly, so share the small fixed vocabulary instead of allocating
+# fresh copies on every load
+_STATUS_RUNNING = sys.intern('running')
+_STATUS_STOPPED = sys.intern('stopped')
+
+
+def _opener_0600(path, flags):
+    """File opener that creates files with owner-only permissions."""
+    return os.open(path, flags, 0o600)
+
 
 class StateManager:
     """Persistent state tracking for Docker stacks and containers."""
@@ -13,6 +25,15 @@ class StateManager:
     STATE_FILE = PROJECT_ROOT / ".docker-state.json"
     COMPOSE_PROJECT = "customer-dashboard"
 
+    # Cache of parsed 'started_at' timestamps, keyed by the ISO string
+    _parsed_started_at: Dict[str, datetime] = {}
+
+    @classmethod
+    def _set_root(cls, root: Path) -> None:
+        """Repoint the class at a different project root (used by tests)."""
+        cls.PROJECT_ROOT = root
+        cls.STATE_FILE = root / ".docker-state.json"
+
     @classmethod
     def get_active_stacks(cls) -> Dict[str, Dict]:
         """Get all currently active stacks with verification."""
@@ -133,7 +154,11 @@ class StateManager:
             return 0
 
         try:
-            started_at = datetime.fromisoformat(started_at_str)
+            started_at = cls._parsed_started_at.get(started_at_str)
+            if started_at is None:
+                started_at = cls._parsed_started_at.setdefault(
+                    started_at_str, datetime.fromisoformat(started_at_str)
+                )
             uptime = datetime.now() - started_at
 
             return int(uptime.total_seconds())
@@ -185,22 +210,27 @@ class StateManager:
         containers = stack_info.get('containers', {})
 
         for container_name in containers:
-            containers[container_name] = 'running' if cls._verify_container_running(container_name) else 'stopped'
+            containers[container_name] = _STATUS_RUNNING if cls._verify_container_running(container_name) else _STATUS_STOPPED
 
         state['active_stacks'][stack_name]['containers'] = containers
         cls._save_state(state)
 
     @classmethod
-    def get_all_ports_in_use(cls) -> List[int]:
-        """Get list of all ports currently in use by active stacks."""
+    def get_all_ports_in_use(cls, active_stacks: Optional[Dict[str, Dict]] = None) -> List[int]:
+        """Get list of all ports currently in use by active stacks.
+
+        Accepts an already-verified stacks dict to avoid a redundant
+        state load and container verification pass.
+        """
         ports = set()
-        active_stacks = cls.get_active_stacks()
+        if active_stacks is None:
+            active_stacks = cls.get_active_stacks()
 
         for stack_info in active_stacks.values():
             stack_ports = stack_info.get('ports', [])
             ports.update(stack_ports)
 
-        return sorted(list(ports))
+        return sorted(ports)
 
     @classmethod
     def check_port_conflicts(cls, stack_name: str) -> List[int]:
@@ -243,9 +273,6 @@ class StateManager:
     @classmethod
     def _load_state(cls) -> Dict:
         """Load state from file, handle missing/corrupt files."""
-        if not cls.STATE_FILE.exists():
-            return cls._create_empty_state()
-
         try:
             with open(cls.STATE_FILE, 'r') as f:
                 state = json.load(f)
@@ -255,12 +282,17 @@ class StateManager:
                     state['active_stacks'] = {}
                 if 'metadata' not in state:
                     state['metadata'] = {}
+                cls._intern_state_strings(state)
                 return state
+        except FileNotFoundError:
+            return cls._create_empty_state()
         except (json.JSONDecodeError, IOError):
             # Preserve corrupted state for debugging
-            if cls.STATE_FILE.exists():
+            try:
                 backup_file = cls.STATE_FILE.with_suffix('.json.backup')
                 cls.STATE_FILE.rename(backup_file)
+            except FileNotFoundError:
+                pass
             return cls._create_empty_state()
 
     @classmethod
@@ -270,16 +302,26 @@ class StateManager:
         state['metadata']['project_root'] = str(cls.PROJECT_ROOT)
         state['metadata']['docker_compose_project'] = cls.COMPOSE_PROJECT
 
+        # State changes can retire 'started_at' strings, so drop cached parses
+        cls._parsed_started_at.clear()
+
         try:
             # Atomic write prevents corruption during save
+            # Create the temp file mode 600 directly so the restrictive
+            # permissions never need a follow-up chmod; the opener mode
+            # only applies on creation, so drop any stale temp file a
+            # crashed run left behind with looser permissions
             temp_file = cls.STATE_FILE.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            temp_file.unlink(missing_ok=True)
+            with open(temp_file, 'w', opener=_opener_0600) as f:
+                # Compact output: the state file is machine-read only, so
+                # pretty-print only when debugging
+                if os.environ.get('STATE_DEBUG'):
+                    json.dump(state, f, indent=2)
+                else:
+                    json.dump(state, f)
 
             temp_file.replace(cls.STATE_FILE)
-
-            # Restrict access to state file for security
-            os.chmod(cls.STATE_FILE, 0o600)
         except IOError as e:
             print(f"Warning: Could not save state: {e}")
 
@@ -296,6 +338,27 @@ class StateManager:
             }
         }
 
+    @classmethod
+    def _intern_state_strings(cls, state: Dict) -> None:
+        """Intern the repeated short strings in a freshly loaded state.
+
+        Interning is an optimization only: leave any value that is not a
+        string untouched so a corrupt state file still flows through
+        _load_state's backup-and-reset handling instead of raising here.
+        """
+        active_stacks = state.get('active_stacks', {})
+        for stack_name in list(active_stacks):
+            stack_info = active_stacks.pop(stack_name)
+            containers = stack_info.get('containers') if isinstance(stack_info, dict) else None
+            if isinstance(containers, dict):
+                # JSON object keys are always strings; only the values
+                # need the type guard
+                stack_info['containers'] = {
+                    sys.intern(name): sys.intern(status) if isinstance(status, str) else status
+                    for name, status in containers.items()
+                }
+            active_stacks[sys.intern(stack_name)] = stack_info
+
     @classmethod
     def _verify_container_running(cls, container_name: str) -> bool:
         """Check if specific container is running."""
@@ -303,10 +366,11 @@ class StateManager:
             result = subprocess.run(
                 ['docker', 'inspect', '-f', '{{.State.Running}}', container_name],
                 capture_output=True,
-                text=True
+                stdin=subprocess.DEVNULL
             )
 
-            return result.returncode == 0 and result.stdout.strip() == 'true'
+            # Compare raw bytes to skip the stdout decode on this hot path
+            return result.returncode == 0 and result.stdout.strip() == b'true'
         except subprocess.CalledProcessError:
             return False
 
@@ -316,7 +380,7 @@ class StateManager:
         containers = {}
         for service in services:
             container_name = f"{cls.COMPOSE_PROJECT}-{service}"
-            status = 'running' if cls._verify_container_running(container_name) else 'stopped'
+            status = _STATUS_RUNNING if cls._verify_container_running(container_name) else _STATUS_STOPPED
             containers[container_name] = status
         return containers
 
@@ -350,9 +414,11 @@ class StateManager:
 
         discovered_count = 0
         try:
+            # Let docker extract the service label so no JSON/label parsing
+            # is needed per line
             result = subprocess.run(
                 [
-                    'docker', 'ps', '--format', '{{json .}}',
+                    'docker', 'ps', '--format', '{{.Label "com.docker.compose.service"}}',
                     '--filter', f'label=com.docker.compose.project={cls.COMPOSE_PROJECT}'
                 ],
                 capture_output=True,
@@ -360,43 +426,24 @@ class StateManager:
                 check=True
             )
 
-            services_running = set()
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    try:
-                        container_data = json.loads(line)
-                        labels = container_data.get('Labels', '')
-
-                        for label_pair in labels.split(','):
-                            if 'com.docker.compose.service=' in label_pair:
-                                service_name = label_pair.split('=', 1)[1]
-                                services_running.add(service_name)
-                                break
-                    except json.JSONDecodeError:
-                        continue
+            services_running = {line for line in result.stdout.splitlines() if line}
 
             if services_running:
                 from .stack_config import StackConfig
                 all_stacks = StackConfig.get_all_stacks()
 
-                # Only match stacks where ALL services are currently running
-                complete_matches = []
-                for stack_info in all_stacks:
-                    stack_id = stack_info['id']
+                # Walk stacks largest-first so specific stacks win over
+                # generic ones, matching and claiming services in one pass
+                used_services = set()
+                for stack_info in sorted(all_stacks, key=lambda s: -len(s['services'])):
                     stack_services = set(stack_info['services'])
 
-                    if stack_services.issubset(services_running):
-                        complete_matches.append((stack_id, stack_services, len(stack_services)))
-
-                # Prefer more specific stacks over generic ones
-                complete_matches.sort(key=lambda x: x[2], reverse=True)
-
-                # Avoid double-counting services across multiple stacks
-                used_services = set()
-                for stack_id, stack_services, service_count in complete_matches:
-                    if not stack_services.intersection(used_services):
+                    # Only match stacks where ALL services are currently
+                    # running and none are claimed by a larger stack
+                    if (stack_services.isdisjoint(used_services)
+                            and stack_services.issubset(services_running)):
                         # Discovered stacks weren't started by user command
-                        cls._mark_stack_active_implicit(stack_id, list(stack_services))
+                        cls._mark_stack_active_implicit(stack_info['id'], list(stack_services))
                         used_services.update(stack_services)
                         discovered_count += 1
 
@@ -450,7 +497,7 @@ class StateManager:
         return {
             'active_stack_count': len(active_stacks),
             'active_stacks': list(active_stacks.keys()),
-            'ports_in_use': cls.get_all_ports_in_use(),
+            'ports_in_use': cls.get_all_ports_in_use(active_stacks),
             'state_file': str(cls.STATE_FILE),
             'state_file_exists': cls.STATE_FILE.exists()
         }
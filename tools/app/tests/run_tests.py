@@ -1,22 +1,45 @@
 #!/usr/bin/env python3
 """Test runner for CLI tool tests."""
 
-import unittest
+import concurrent.futures
+import os
+import subprocess
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+TESTS_DIR = Path(__file__).parent
+
+def run_module(module_path):
+    """Run a single test module in its own process."""
+    result = subprocess.run(
+        [sys.executable, '-m', 'unittest', '-v', module_path.stem],
+        cwd=TESTS_DIR,
+        capture_output=True,
+        text=True
+    )
+    return result.returncode, result.stdout + result.stderr
+
 def run_tests():
-    """Run all tests in the test suite."""
-    loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return 0 if result.wasSuccessful() else 1
+    """Run all test modules in parallel, one process per module.
+
+    The suite is I/O-bound (fixture trees are written and removed on
+    disk) and each module already isolates its own state, so modules
+    fan out across cores. Separate processes also keep the per-class
+    caches and PROJECT_ROOT mutations from crossing module boundaries.
+    """
+    modules = sorted(TESTS_DIR.glob('test_*.py'))
+    workers = min(len(modules), os.cpu_count() or 1)
+    exit_code = 0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        for returncode, output in pool.map(run_module, modules):
+            sys.stderr.write(output)
+            if returncode != 0:
+                exit_code = 1
+
+    return exit_code
 
 if __name__ == '__main__':
-    sys.exit(run_tests())
\ No newline at end of file
+    sys.exit(run_tests())
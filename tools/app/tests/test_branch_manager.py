@@ -5,25 +5,33 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
-import yaml
+import json
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from app.branch_manager import BranchManager
 
+# Keep fixture trees in RAM when a tmpfs mount is available
+_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Default restored in teardown; resolve the repo root once at import
+_DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
 
 class TestBranchManager(unittest.TestCase):
     """Test cases for BranchManager class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.branches_file = Path(self.test_dir) / 'branches.yml'
-        
-        self.original_project_root = os.environ.get('PROJECT_ROOT')
-        
-        branches_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared registry fixture for the class."""
+        cls._tmp = tempfile.TemporaryDirectory(dir=_TMP_DIR)
+        cls.test_dir = cls._tmp.name
+        cls.branches_file = Path(cls.test_dir) / 'branches.yml'
+
+        cls.original_project_root = os.environ.get('PROJECT_ROOT')
+
+        cls.branches_data = {
             'branches': {
                 'feature/test-branch': {
                     'title': 'Test Branch',
@@ -57,32 +65,37 @@ class TestBranchManager(unittest.TestCase):
             }
         }
         
-        with open(self.branches_file, 'w') as f:
-            yaml.dump(branches_data, f)
-        
-        os.environ['PROJECT_ROOT'] = self.test_dir
-        
-        BranchManager.PROJECT_ROOT = Path(self.test_dir)
-        BranchManager.REGISTRY_FILE = self.branches_file
-        
+        cls.write_registry()
+
+        os.environ['PROJECT_ROOT'] = cls.test_dir
+
+        BranchManager.PROJECT_ROOT = Path(cls.test_dir)
+        BranchManager.REGISTRY_FILE = cls.branches_file
+
         # Clear the cache
         BranchManager.load_branch_registry.cache_clear()
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.test_dir)
-        
-        if self.original_project_root is not None:
-            os.environ['PROJECT_ROOT'] = self.original_project_root
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared registry fixture."""
+        cls._tmp.cleanup()
+
+        if cls.original_project_root is not None:
+            os.environ['PROJECT_ROOT'] = cls.original_project_root
         elif 'PROJECT_ROOT' in os.environ:
             del os.environ['PROJECT_ROOT']
-        
-        BranchManager.PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT', Path(__file__).parent.parent.parent.parent.parent))
+
+        BranchManager.PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT', _DEFAULT_PROJECT_ROOT))
         BranchManager.REGISTRY_FILE = BranchManager.PROJECT_ROOT / "branches.yml"
-        
+
         # Clear the cache
         BranchManager.load_branch_registry.cache_clear()
+
+    @classmethod
+    def write_registry(cls):
+        """(Re)write the shared branches.yml fixture."""
+        with open(cls.branches_file, 'w') as f:
+            json.dump(cls.branches_data, f)
     
     def test_load_branch_registry(self):
         """Test loading branch registry."""
@@ -212,7 +225,11 @@ class TestBranchManager(unittest.TestCase):
     def test_missing_branches_file(self):
         """Test handling when branches.yml doesn't exist."""
         self.branches_file.unlink()
-        
+
+        # Restore the shared fixture for any tests that run after this one
+        self.addCleanup(self.write_registry)
+        self.addCleanup(BranchManager.load_branch_registry.cache_clear)
+
         BranchManager.load_branch_registry.cache_clear()
         
         with self.assertRaises(FileNotFoundError):
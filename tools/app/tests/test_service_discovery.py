@@ -5,55 +5,64 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
-import yaml
+import json
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from app.service_discovery import ServiceDiscovery
 
+# Keep fixture trees in RAM when a tmpfs mount is available
+_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Default restored in teardown; resolve the repo root once at import
+_DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
 
 class TestServiceDiscovery(unittest.TestCase):
     """Test cases for ServiceDiscovery class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.services_dir = Path(self.test_dir) / 'docker' / 'services'
-        self.services_dir.mkdir(parents=True)
-        
-        self.create_test_service('php-fpm', 'php', ['web', 'cli'], 'PHP-FPM processor')
-        self.create_test_service('mysql', 'database', ['storage', 'primary'], 'MySQL database')
-        self.create_test_service('redis', 'cache', ['cache', 'session', 'queue'], 'Redis server')
-        self.create_test_service('nginx', 'proxy', ['web'], 'Nginx reverse proxy')
-        
-        self.original_project_root = os.environ.get('PROJECT_ROOT')
-        
-        os.environ['PROJECT_ROOT'] = self.test_dir
-        
-        ServiceDiscovery.PROJECT_ROOT = Path(self.test_dir)
-        ServiceDiscovery.SERVICE_DIR = Path(self.test_dir) / "docker" / "services"
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared fixture tree; the tests only read from it."""
+        cls._tmp = tempfile.TemporaryDirectory(dir=_TMP_DIR)
+        cls.test_dir = cls._tmp.name
+        cls.services_dir = Path(cls.test_dir) / 'docker' / 'services'
+        cls.services_dir.mkdir(parents=True)
+
+        cls.create_test_service('php-fpm', 'php', ['web', 'cli'], 'PHP-FPM processor')
+        cls.create_test_service('mysql', 'database', ['storage', 'primary'], 'MySQL database')
+        cls.create_test_service('redis', 'cache', ['cache', 'session', 'queue'], 'Redis server')
+        cls.create_test_service('nginx', 'proxy', ['web'], 'Nginx reverse proxy')
+
+        cls.original_project_root = os.environ.get('PROJECT_ROOT')
+
+        os.environ['PROJECT_ROOT'] = cls.test_dir
+
+        ServiceDiscovery.PROJECT_ROOT = Path(cls.test_dir)
+        ServiceDiscovery.SERVICE_DIR = Path(cls.test_dir) / "docker" / "services"
+
         ServiceDiscovery._load_service_file.cache_clear()
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.test_dir)
-        
-        if self.original_project_root is not None:
-            os.environ['PROJECT_ROOT'] = self.original_project_root
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared fixture tree."""
+        cls._tmp.cleanup()
+
+        if cls.original_project_root is not None:
+            os.environ['PROJECT_ROOT'] = cls.original_project_root
         elif 'PROJECT_ROOT' in os.environ:
             del os.environ['PROJECT_ROOT']
-        
-        ServiceDiscovery.PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT', Path(__file__).parent.parent.parent.parent.parent))
+
+        ServiceDiscovery.PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT', _DEFAULT_PROJECT_ROOT))
         ServiceDiscovery.SERVICE_DIR = ServiceDiscovery.PROJECT_ROOT / "docker" / "services"
-        
+
         ServiceDiscovery._load_service_file.cache_clear()
-    
-    def create_test_service(self, name, service_type, roles, description):
+
+    @classmethod
+    def create_test_service(cls, name, service_type, roles, description):
         """Create a test service file."""
-        service_file = self.services_dir / f'{name}.yml'
+        service_file = cls.services_dir / f'{name}.yml'
         service_data = {
             'services': {
                 name: {
@@ -68,7 +77,7 @@ class TestServiceDiscovery(unittest.TestCase):
         }
         
         with open(service_file, 'w') as f:
-            yaml.dump(service_data, f)
+            json.dump(service_data, f)
     
     def test_find_services_by_type(self):
         """Test finding services by type."""
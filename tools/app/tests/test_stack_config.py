@@ -2,101 +2,120 @@
 """Tests for stack configuration functionality."""
 
 import unittest
+from unittest import mock
 import tempfile
 import os
 from pathlib import Path
-import yaml
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from app.stack_config import StackConfig
 
+# Keep fixture trees in RAM when a tmpfs mount is available
+_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Default restored in teardown; resolve the repo root once at import
+_DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+# The fixtures are fixed literals, so write the YAML by hand and skip
+# the PyYAML emitter entirely on the test side
+_STACK_YAML = {
+    'default': """\
+id: default
+name: Default
+description: Default development stack
+access_url: http://localhost
+requirements:
+  min_memory: 2GB
+  ports:
+  - 80
+  - 3306
+  - 6379
+  features:
+  - traditional_lamp
+services:
+- nginx
+- php-fpm
+- mysql
+- redis
+""",
+    'octane': """\
+id: octane
+name: Octane
+description: High-performance Laravel Octane stack
+access_url: http://localhost:8000
+requirements:
+  min_memory: 4GB
+  ports:
+  - 8000
+  - 3306
+  - 6379
+  features:
+  - swoole
+  - long_running_processes
+services:
+- octane
+- mysql
+- redis
+""",
+}
+
+def _service_yaml(service):
+    """Render a service fixture as literal YAML."""
+    return (
+        "services:\n"
+        f"  {service}:\n"
+        f"    image: {service}:latest\n"
+        "    labels:\n"
+        f"    - com.customer-dashboard.service.type={service}\n"
+    )
 
 class TestStackConfig(unittest.TestCase):
     """Test cases for StackConfig class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.stacks_dir = Path(self.test_dir) / 'docker' / 'stacks'
-        self.stacks_dir.mkdir(parents=True)
-        
-        self.create_test_stack('default', {
-            'id': 'default',
-            'name': 'Default',
-            'description': 'Default development stack',
-            'access_url': 'http://localhost',
-            'requirements': {
-                'min_memory': '2GB',
-                'ports': [80, 3306, 6379],
-                'features': ['traditional_lamp']
-            },
-            'services': ['nginx', 'php-fpm', 'mysql', 'redis']
-        })
-        
-        self.create_test_stack('octane', {
-            'id': 'octane',
-            'name': 'Octane',
-            'description': 'High-performance Laravel Octane stack',
-            'access_url': 'http://localhost:8000',
-            'requirements': {
-                'min_memory': '4GB',
-                'ports': [8000, 3306, 6379],
-                'features': ['swoole', 'long_running_processes']
-            },
-            'services': ['octane', 'mysql', 'redis']
-        })
-        
-        self.original_project_root = os.environ.get('PROJECT_ROOT')
-        
-        services_dir = Path(self.test_dir) / 'docker' / 'services'
-        services_dir.mkdir(parents=True, exist_ok=True)
-        
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared stack/service fixture tree once for the class."""
+        cls._tmp = tempfile.TemporaryDirectory(dir=_TMP_DIR)
+        cls.addClassCleanup(cls._tmp.cleanup)
+        cls.test_dir = cls._tmp.name
+        cls.stacks_dir = Path(cls.test_dir) / 'docker' / 'stacks'
+        services_dir = Path(cls.test_dir) / 'docker' / 'services'
+
+        # One pass creates the whole fixture tree; the shared docker/
+        # parent only gets stat'd here, not once per subdirectory
+        for directory in (cls.stacks_dir, services_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        for name, yaml_text in _STACK_YAML.items():
+            cls.create_test_stack(name, yaml_text)
+
         for service in ['nginx', 'php-fpm', 'mysql', 'redis', 'octane']:
-            service_file = services_dir / f'{service}.yml'
-            service_content = {
-                'services': {
-                    service: {
-                        'image': f'{service}:latest',
-                        'labels': [f'com.customer-dashboard.service.type={service}']
-                    }
-                }
-            }
-            with open(service_file, 'w') as f:
-                yaml.dump(service_content, f)
-        
-        os.environ['PROJECT_ROOT'] = self.test_dir
-        
-        StackConfig.PROJECT_ROOT = Path(self.test_dir)
-        StackConfig.STACK_DIR = Path(self.test_dir) / "docker" / "stacks"
-        StackConfig.SERVICE_DIR = Path(self.test_dir) / "docker" / "services"
-        
-        if hasattr(StackConfig, 'load_stack_config'):
-            StackConfig.load_stack_config.cache_clear()
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.test_dir)
-        
-        if self.original_project_root is not None:
-            os.environ['PROJECT_ROOT'] = self.original_project_root
-        elif 'PROJECT_ROOT' in os.environ:
-            del os.environ['PROJECT_ROOT']
-        
-        StackConfig.PROJECT_ROOT = Path(os.environ.get('PROJECT_ROOT', Path(__file__).parent.parent.parent.parent.parent))
-        StackConfig.STACK_DIR = StackConfig.PROJECT_ROOT / "docker" / "stacks"
-        StackConfig.SERVICE_DIR = StackConfig.PROJECT_ROOT / "docker" / "services"
-        
-        if hasattr(StackConfig, 'load_stack_config'):
-            StackConfig.load_stack_config.cache_clear()
-    
-    def create_test_stack(self, name, config):
-        """Create a test stack file."""
-        stack_file = self.stacks_dir / f'{name}.yml'
-        with open(stack_file, 'w') as f:
-            yaml.dump(config, f)
+            (services_dir / f'{service}.yml').write_text(_service_yaml(service))
+
+        # Warm the config cache so every test hits a dict lookup instead
+        # of a YAML parse; the cache is keyed on the fixture stack dir
+        for stack_name in _STACK_YAML:
+            StackConfig._load_stack_config(str(cls.stacks_dir), stack_name)
+
+    def setUp(self):
+        """Point StackConfig at the shared fixture tree."""
+        # Compute the restore target before patching, and register it
+        # via addCleanup so it runs after patch.dict (entered below) has
+        # put the original environment back
+        restore_root = Path(os.environ.get('PROJECT_ROOT', _DEFAULT_PROJECT_ROOT))
+        self.addCleanup(StackConfig._set_root, restore_root)
+
+        # patch.dict restores the environment automatically on cleanup
+        self.enterContext(mock.patch.dict(os.environ, {'PROJECT_ROOT': self.test_dir}))
+
+        StackConfig._set_root(Path(self.test_dir))
+
+    @classmethod
+    def create_test_stack(cls, name, yaml_text):
+        """Create a test stack file from pre-serialized YAML."""
+        (cls.stacks_dir / f'{name}.yml').write_text(yaml_text)
     
     def test_load_stack_config(self):
         """Test loading stack configuration."""